@@ -4,8 +4,9 @@ import json
 # Update the .env file with the answers from the .copier-answers.yml file
 # without using Jinja2 templates in the .env file, this way the code works as is
 # without needing Copier, but if Copier is used, the .env file will be updated
-root_path = Path(__file__).parent.parent
-answers_path = Path(__file__).parent / ".copier-answers.yml"
+copier_path = Path(__file__).parent
+root_path = copier_path.parent
+answers_path = copier_path / ".copier-answers.yml"
 answers = json.loads(answers_path.read_text())
 env_path = root_path / ".env"
 env_content = env_path.read_text()
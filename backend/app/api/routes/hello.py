@@ -1,8 +1,17 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+from pydantic import BaseModel
 
 router = APIRouter()
 
 
-@router.get("")
-async def hello():
-    return {"message": "Hello from FastAPI!"}
+class HelloResponse(BaseModel):
+    message: str
+
+
+# Pre-encoded body, skips response serialization on every request
+_PAYLOAD = HelloResponse(message="Hello from FastAPI!").model_dump_json().encode()
+
+
+@router.get("", response_class=Response, responses={200: {"model": HelloResponse}})
+async def hello() -> Response:
+    return Response(content=_PAYLOAD, media_type="application/json")
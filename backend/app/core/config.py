@@ -1,7 +1,8 @@
-from pydantic_settings import BaseSettings
-from typing import List
 import os
+from functools import lru_cache
+
 from dotenv import load_dotenv
+from pydantic_settings import BaseSettings
 
 # Load environment variables from .env file
 load_dotenv()
@@ -10,18 +11,28 @@ load_dotenv()
 class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "backend"
-    BACKEND_CORS_ORIGINS: List[str] = [
+    BACKEND_CORS_ORIGINS: tuple[str, ...] = (
         "http://localhost:5173",
         "http://127.0.0.1:5173",
-    ]
-    DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
-    PORT: int = int(os.getenv("PORT", "8000"))
+    )
+    DEBUG: bool = os.environ.get("DEBUG", "False").lower() == "true"
+    PORT: int = int(os.environ.get("PORT", "8000"))
     # Database settings
 
-    DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./app.db")
+    DATABASE_URL: str = os.environ.get("DATABASE_URL", "sqlite:///./app.db")
 
     class Config:
         case_sensitive = True
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings.
+
+    `settings` below is bound at import; code that needs to see overrides
+    after `get_settings.cache_clear()` should call `get_settings()` instead.
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -1,5 +1,6 @@
 # Import models here
-{% if cookiecutter.use_sqlmodel == "y" %}
 from sqlmodel import SQLModel
+
 from app.models.base import Base
-{% endif %} 
\ No newline at end of file
+
+__all__ = ["SQLModel", "Base"]
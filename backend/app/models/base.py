@@ -1,11 +1,36 @@
-from datetime import datetime
-from typing import Optional
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from pydantic import computed_field
+from sqlalchemy import BigInteger
 from sqlmodel import Field, SQLModel
 
 
 class Base(SQLModel):
     """Base model for all database models"""
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    id: int | None = Field(default=None, primary_key=True)
+    # Stored as UTC epoch nanoseconds; excluded from output since they exceed
+    # JS Number precision, the *_datetime fields are serialized instead
+    created_at: int = Field(
+        default_factory=time.time_ns, sa_type=BigInteger, exclude=True
+    )
+    updated_at: int = Field(
+        default_factory=time.time_ns, sa_type=BigInteger, exclude=True
+    )
+
+    def model_post_init(self, __context: Any) -> None:
+        # A new row starts with updated_at == created_at
+        if "updated_at" not in self.model_fields_set:
+            self.updated_at = self.created_at
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def created_datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.created_at / 1e9, tz=timezone.utc)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def updated_datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.updated_at / 1e9, tz=timezone.utc)